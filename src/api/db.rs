@@ -1,5 +1,6 @@
 use axum::{
     extract::{Path, State},
+    http::HeaderValue,
     response::{IntoResponse, Response},
     Json,
 };
@@ -7,6 +8,7 @@ use chrono::{DateTime, Utc};
 use futures::StreamExt;
 use serde::{Deserialize, Serialize};
 use std::sync::Arc;
+use std::time::Instant;
 use uuid::Uuid;
 
 use crate::db::instance::InstanceStatus;
@@ -187,23 +189,33 @@ pub async fn execute_query(
 
     let instance = state.manager.get_instance(db_id).await?;
     let format = req.resolve_format();
+    let started = Instant::now();
 
-    match format {
+    let mut response = match format {
         OutputFormat::Text => {
             // Return raw CLI output
             let output = state.query_executor.execute_raw(&instance, &req.query).await?;
-            Ok(create_text_response(output))
+            create_text_response(output)
         }
         OutputFormat::Json => {
             // Return traditional JSON array
             let stream = state.query_executor.execute(&instance, &req.query).await?;
             let events: Vec<_> = stream.collect().await;
-            Ok(create_json_response(events).into_response())
+            create_json_response(events).into_response()
         }
         OutputFormat::Jsonl => {
             // Return SSE stream with JSONL events
             let stream = state.query_executor.execute(&instance, &req.query).await?;
-            Ok(create_sse_response(stream).into_response())
+            create_sse_response(stream).into_response()
         }
+    };
+
+    // The CLI has finished by now (SSE only replays its parsed output), so
+    // this covers the full query execution time on the server
+    let server_timing = format!("db;dur={:.1}", started.elapsed().as_secs_f64() * 1000.0);
+    if let Ok(value) = HeaderValue::from_str(&server_timing) {
+        response.headers_mut().insert("server-timing", value);
     }
+
+    Ok(response)
 }
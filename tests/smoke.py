@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""Smoke tests for all db-api dialects.
+
+Runs every dialect in one process so interpreter startup and the HTTP
+connection pool are shared. Pass dialect names to run a subset:
+
+    python tests/smoke.py            # all dialects
+    python tests/smoke.py mysql      # just MySQL
+    python tests/smoke.py -v         # also print the selected rows
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import ssl
+import sys
+import time
+
+import certifi
+import httpcore
+
+# orjson decodes result sets several times faster; fall back to stdlib json
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
+
+DIALECTS = {
+    "mssql": {
+        "name": "MSSQL",
+        "url": "https://db-api.ljs.app",
+        "create_timeout": 180,
+        "ddl": """
+CREATE TABLE users (
+    id INT IDENTITY(1,1) PRIMARY KEY,
+    name NVARCHAR(255) NOT NULL,
+    email NVARCHAR(255) NOT NULL,
+    created_at DATETIME2 DEFAULT GETDATE()
+)
+""",
+    },
+    "mysql": {
+        "name": "MySQL",
+        "url": "http://localhost:8013",
+        "create_timeout": 120,
+        "ddl": """
+CREATE TABLE users (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+)
+""",
+    },
+}
+
+USERS = [
+    ("Alice", "alice@example.com"),
+    ("Bob", "bob@example.com"),
+    ("Charlie", "charlie@example.com"),
+]
+
+
+def sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal, doubling embedded quotes."""
+    return "'" + value.replace("'", "''") + "'"
+
+
+# One multi-row INSERT for all users; the API runs SQL through the database
+# CLI, so there is no prepared-statement or bulk endpoint to bind rows to
+INSERT_SQL = "INSERT INTO users (name, email) VALUES\n" + ",\n".join(
+    f"({sql_literal(name)}, {sql_literal(email)})" for name, email in USERS
+)
+
+SELECT_SQL = "SELECT id, name, email FROM users ORDER BY id"
+
+# Resets a pooled database so it can be reused instead of provisioned
+RESET_SQL = "DROP TABLE IF EXISTS users"
+
+def encode_query(*statements: str) -> bytes:
+    """JSON request body running the statements as one batch."""
+    sql = ";\n".join(q.strip() for q in statements)
+    return json.dumps({"query": sql}).encode()
+
+
+# Request bodies are encoded once at import rather than on every post
+JSON_HEADERS = [(b"content-type", b"application/json")]
+RESET_BODY = encode_query(RESET_SQL)
+CREATE_BODIES = {
+    dialect: json.dumps({"dialect": dialect}).encode() for dialect in DIALECTS
+}
+
+# CREATE TABLE + INSERT + SELECT are sent as a single request so the three
+# statements cost one round-trip
+BATCH_BODIES = {
+    dialect: encode_query(config["ddl"], INSERT_SQL, SELECT_SQL)
+    for dialect, config in DIALECTS.items()
+}
+
+
+# Shared by every client so the CA bundle is loaded once
+SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+
+def base_url(dialect: str) -> str:
+    """DB_API_URL overrides the per-dialect default server."""
+    return os.environ.get("DB_API_URL", DIALECTS[dialect]["url"])
+
+
+class HTTPError(Exception):
+    """Non-2xx response from db-api."""
+
+
+# Failures that mean the server could not be reached or answered badly
+REQUEST_ERRORS = (
+    HTTPError,
+    httpcore.NetworkError,
+    httpcore.TimeoutException,
+    httpcore.ProtocolError,
+)
+
+
+class Client:
+    """Thin JSON client over an httpcore connection pool.
+
+    httpx's Request/Response models, hooks and auth layers are not needed
+    for a handful of small JSON calls against one host.
+    """
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        # One pool per server so keep-alive reuses the connection instead of
+        # paying a TCP+TLS handshake per request
+        self.pool = httpcore.AsyncConnectionPool(
+            ssl_context=SSL_CONTEXT,
+            http2=True,
+            max_connections=4,
+        )
+
+    async def request(
+        self, method: bytes, path: str, body: bytes | None = None, timeout: float = 30.0
+    ) -> httpcore.Response:
+        resp = await self.pool.request(
+            method,
+            self.base_url + path,
+            headers=JSON_HEADERS if body is not None else None,
+            content=body,
+            extensions={"timeout": {
+                "connect": 10.0, "read": timeout, "write": timeout, "pool": timeout,
+            }},
+        )
+        if resp.status >= 400:
+            raise HTTPError(f"{method.decode()} {path} returned HTTP {resp.status}")
+        return resp
+
+    async def aclose(self):
+        await self.pool.aclose()
+
+
+def server_timing(resp: httpcore.Response) -> float | None:
+    """Seconds reported by the server's Server-Timing header, if present."""
+    for name, value in resp.headers:
+        if name.lower() == b"server-timing" and b"dur=" in value:
+            return float(value.split(b"dur=")[-1]) / 1000
+    return None
+
+
+async def create_database(client: Client, dialect: str) -> dict:
+    resp = await client.request(
+        b"POST",
+        "/db/new",
+        CREATE_BODIES[dialect],
+        timeout=DIALECTS[dialect]["create_timeout"],
+    )
+    return loads(resp.content)
+
+
+async def run_query(
+    client: Client, query_url: str, body: bytes
+) -> tuple[dict, float | None]:
+    resp = await client.request(b"POST", query_url, body)
+    return loads(resp.content), server_timing(resp)
+
+
+async def reset_database(client: Client, db_id: str) -> bool:
+    """Reset a pooled database, returning False if it is no longer usable."""
+    try:
+        resp = await client.request(b"POST", f"/db/{db_id}/query", RESET_BODY)
+        return "error" not in loads(resp.content)
+    except REQUEST_ERRORS:
+        return False
+
+
+async def destroy_database(client: Client, db_url: str) -> dict:
+    resp = await client.request(b"DELETE", db_url)
+    return loads(resp.content)
+
+
+async def run_smoke(
+    client: Client, dialect: str, verbose: bool = False
+) -> int:
+    config = DIALECTS[dialect]
+    name = config["name"]
+    print(f"=== {name} Smoke Test ===\n")
+    timings = []
+
+    # Reuse a pooled database when DB_API_POOL_<DIALECT> is set; an empty or
+    # stale id provisions a fresh database that is kept for the next run
+    pool_var = f"DB_API_POOL_{dialect.upper()}"
+    pool_id = os.environ.get(pool_var)
+    pooled = pool_id is not None
+
+    # 1. Create database (or reset the pooled one)
+    db_id = None
+    if pool_id:
+        print(f"1. Resetting pooled {name} database {pool_id}...")
+        start = time.perf_counter()
+        ok = await reset_database(client, pool_id)
+        elapsed = time.perf_counter() - start
+        if ok:
+            db_id = pool_id
+            print(f"   Time: {elapsed:.3f}s")
+            timings.append(("Reset pooled database", elapsed))
+        else:
+            print("   Pooled database unavailable, provisioning a new one")
+    if db_id is None:
+        print(f"1. Creating {name} database...")
+        start = time.perf_counter()
+        data = await create_database(client, dialect)
+        elapsed = time.perf_counter() - start
+        db_id = data["db_id"]
+        print(f"   Created: {db_id}")
+        print(f"   Status: {data['status']}")
+        print(f"   Time: {elapsed:.2f}s")
+        timings.append(("Create database", elapsed))
+
+    db_url = f"/db/{db_id}"
+    query_url = f"{db_url}/query"
+
+    try:
+        # 2. Create table, insert and select in one batch
+        print("\n2. Creating table, inserting and selecting data...")
+        start = time.perf_counter()
+        data, server_elapsed = await run_query(client, query_url, BATCH_BODIES[dialect])
+        elapsed = time.perf_counter() - start
+        if "error" in data:
+            print(f"\n=== FAILED: {data['error']} ===")
+            return 1
+        print("   Created+inserted+selected in one batch")
+        print(f"   Columns: {data['columns']}")
+        if verbose:
+            # One write for all rows instead of a print per row
+            sys.stdout.write("   Rows:\n" + "".join(f"     {r}\n" for r in data["rows"]))
+        print(f"   Time: {elapsed:.3f}s")
+        if server_elapsed is not None:
+            # Query execution only, as reported by the Server-Timing header
+            print(f"   Server time: {server_elapsed:.3f}s")
+        timings.append(("Create+insert+select", elapsed))
+
+        # 3. Verify row count from select
+        print("\n3. Verifying row count...")
+        row_count = len(data["rows"])
+        print(f"   Total rows: {row_count}")
+
+        # Print timing summary
+        print("\n--- Timing Summary ---")
+        total = 0
+        for step, t in timings:
+            print(f"   {step}: {t:.3f}s")
+            total += t
+        print(f"   Total: {total:.2f}s")
+
+        if row_count == len(USERS):
+            print("\n=== PASSED ===")
+            return 0
+        else:
+            print(f"\n=== FAILED: Expected {len(USERS)} rows, got {row_count} ===")
+            return 1
+
+    finally:
+        if pooled:
+            # Keep the database for the next run
+            print("\nKeeping pooled database, reuse with:")
+            print(f"   export {pool_var}={db_id}")
+        else:
+            # Cleanup: destroy database
+            print(f"\nCleaning up: destroying database {db_id}...")
+            # Always let DELETE finish: cancelling it mid-flight can drop the
+            # server handler after the instance is uncached but before its
+            # database and metadata are removed
+            try:
+                start = time.perf_counter()
+                await destroy_database(client, db_url)
+                elapsed = time.perf_counter() - start
+                print(f"   Database destroyed ({elapsed:.3f}s)")
+            except Exception as e:
+                print(f"   Warning: cleanup failed: {e}")
+
+
+async def run_all(dialects: list[str], verbose: bool = False) -> int:
+    """Run the given dialects in order, returning 1 if any failed."""
+    clients = {}
+    failed = False
+    try:
+        for i, dialect in enumerate(dialects):
+            if i:
+                print()
+            url = base_url(dialect)
+            if url not in clients:
+                clients[url] = Client(url)
+            try:
+                if await run_smoke(clients[url], dialect, verbose):
+                    failed = True
+            except Exception as e:
+                print(f"\n=== FAILED: {e} ===")
+                failed = True
+    finally:
+        for client in clients.values():
+            await client.aclose()
+    return 1 if failed else 0
+
+
+def make_parser(with_dialects: bool = True) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Smoke test db-api dialects")
+    if with_dialects:
+        parser.add_argument(
+            "dialects", nargs="*", metavar="dialect",
+            help=f"dialects to test (default: all of {', '.join(DIALECTS)})",
+        )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="print the selected rows",
+    )
+    return parser
+
+
+def run_one(dialect: str) -> int:
+    """Entry point for the per-dialect scripts; accepts flags only."""
+    args = make_parser(with_dialects=False).parse_args()
+    return asyncio.run(run_all([dialect], args.verbose))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = make_parser()
+    args = parser.parse_args(argv)
+    unknown = [d for d in args.dialects if d not in DIALECTS]
+    if unknown:
+        parser.error(f"unknown dialect(s): {', '.join(unknown)}")
+    return asyncio.run(run_all(args.dialects or list(DIALECTS), args.verbose))
+
+
+if __name__ == "__main__":
+    sys.exit(main())